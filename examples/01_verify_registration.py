@@ -7,6 +7,7 @@ This example loads The Nurse's Oath and verifies the OpenPGP signature.
 """
 
 import sys
+import logging
 import json
 from pathlib import Path
 
@@ -80,4 +81,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Show per-signature verification details
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
     main()
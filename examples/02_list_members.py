@@ -7,6 +7,7 @@ Scans the registration directory and verifies all signatures.
 """
 
 import sys
+import logging
 from pathlib import Path
 
 # Add src to path for imports
@@ -63,4 +64,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Show per-signature verification details
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
     main()
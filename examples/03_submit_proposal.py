@@ -7,6 +7,7 @@ This shows how governance operations require cryptographic identity verification
 """
 
 import sys
+import logging
 from pathlib import Path
 
 # Add src to path for imports
@@ -84,4 +85,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Show per-signature verification details
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
     main()
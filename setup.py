@@ -45,6 +45,11 @@ setup(
         "cryptography>=41.0.0",
     ],
     extras_require={
+        "fast": [
+            "coincurve>=18.0.0",
+            "orjson>=3.8.0",
+            "PGPy>=0.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Windows console encoding fix shared by the governance modules
+
+Status output uses emoji, which the default Windows console code page
+cannot encode. configure() switches stdout/stderr to UTF-8 once per process.
+"""
+
+import sys
+
+_configured = False
+
+
+def _needs_utf8(stream) -> bool:
+    """True if the stream exists and does not already encode UTF-8"""
+    encoding = getattr(stream, 'encoding', None)
+    return stream is not None and (encoding or '').lower().replace('-', '') != 'utf8'
+
+
+def configure() -> None:
+    """
+    Reconfigure stdout/stderr to UTF-8 on Windows (no-op after the first call)
+
+    Nothing is done on other platforms, in UTF-8 mode, or when the streams
+    already use UTF-8 (e.g. PYTHONIOENCODING=utf-8).
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    if sys.platform != 'win32' or sys.flags.utf8_mode:
+        return
+    if not (_needs_utf8(sys.stdout) or _needs_utf8(sys.stderr)):
+        return
+
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except AttributeError:
+        import codecs
+        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
@@ -4,23 +4,451 @@ Governance Crypto Module - OpenPGP Integration for Mainscript.py
 Adds OpenPGP signing to complement ECDSA for enhanced verification
 """
 
+import atexit
+import shutil
 import subprocess
 import json
 import hashlib
+import logging
+import os
+import re
 import tempfile
+import threading
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union, Iterable
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+try:
+    import coincurve  # libsecp256k1 bindings, optional ECDSA accelerator
+except ImportError:
+    coincurve = None
+
+try:
+    import pgpy  # pure-Python OpenPGP, optional in-process verification
+except ImportError:
+    pgpy = None
+
+try:
+    import _win_console
+except ImportError:
+    # Imported as part of the src package (from src.governance_crypto import ...)
+    from . import _win_console
 
 # Fix Windows console encoding
-if sys.platform == 'win32':
+_win_console.configure()
+
+# Per-entry progress is logged at DEBUG, failures at WARNING
+logger = logging.getLogger(__name__)
+
+
+# Reused compact canonical encoder (json.dumps builds a new one per call)
+_COMPACT_SEPARATORS = (',', ':')
+_COMPACT_ENCODER = json.JSONEncoder(sort_keys=True, separators=_COMPACT_SEPARATORS)
+
+# Key sets of the payloads signed in practice: registration entries with
+# their signature fields removed. Payloads with exactly these keys use an
+# encoder specialized for that shape instead of the generic encoder.
+_KNOWN_PAYLOAD_KEYS = (
+    ('proof_data', 'proof_name', 'timestamp'),
+)
+
+
+def _encode_value(value) -> str:
+    """Encode a single value exactly as _COMPACT_ENCODER would"""
+    kind = type(value)
+    if kind is str:
+        return encode_basestring_ascii(value)
+    if kind is int:
+        return int.__repr__(value)
+    return _COMPACT_ENCODER.encode(value)
+
+
+def _compile_payload_encoder(keys: Iterable[str]):
+    """
+    Build a canonical JSON encoder for payloads with a fixed set of keys
+
+    Key order and the '{"key":' / ',"key":' fragments are computed once, so
+    each call only encodes the values and joins the pieces.
+
+    Args:
+        keys: Exact key set of the payload
+
+    Returns:
+        Function mapping an entry (which may hold extra, excluded keys) to bytes
+    """
+    ordered = sorted(keys)
+    fields = tuple(
+        (('{' if i == 0 else ',') + encode_basestring_ascii(key) + ':', key)
+        for i, key in enumerate(ordered)
+    )
+
+    def encode(entry: Dict) -> bytes:
+        parts = []
+        for prefix, key in fields:
+            parts.append(prefix)
+            parts.append(_encode_value(entry[key]))
+        parts.append('}')
+        return ''.join(parts).encode('utf-8')
+
+    return encode
+
+
+_PAYLOAD_ENCODERS = {
+    frozenset(keys): _compile_payload_encoder(keys) for keys in _KNOWN_PAYLOAD_KEYS
+}
+
+
+def _canonical(entry: Dict, exclude: Iterable[str],
+               separators: Tuple[str, str] = _COMPACT_SEPARATORS) -> bytes:
+    """
+    Serialize an entry to canonical JSON bytes, leaving out signature fields
+
+    Args:
+        entry: Registration entry dict
+        exclude: Keys omitted from the signed payload (ideally a frozenset)
+        separators: JSON separators (compact by default)
+
+    Returns:
+        UTF-8 encoded canonical JSON, ready to hash, sign or verify
+    """
+    if not isinstance(exclude, frozenset):
+        exclude = frozenset(exclude)
+
+    if separators == _COMPACT_SEPARATORS:
+        encoder = _PAYLOAD_ENCODERS.get(frozenset(entry.keys() - exclude))
+        if encoder is not None:
+            return encoder(entry)
+
+    # Only copy the entry when there is something to leave out
+    payload = entry if exclude.isdisjoint(entry) else \
+        {k: v for k, v in entry.items() if k not in exclude}
+    return json.dumps(payload, sort_keys=True, separators=separators).encode('utf-8')
+
+
+# SECP256k1 group order, used to fold signatures into libsecp256k1's low-S form
+_SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+@lru_cache(maxsize=64)
+def _ecdsa_verifying_key(public_key_hex: str):
+    """
+    Parse a SECP256k1 verifying key from hex (cached per key)
+
+    Args:
+        public_key_hex: Raw x||y public key, hex encoded
+
+    Returns:
+        coincurve.PublicKey if coincurve is installed, else a cryptography
+        EllipticCurvePublicKey
+    """
+    point = b'\x04' + bytes.fromhex(public_key_hex)
+    if coincurve is not None:
+        return coincurve.PublicKey(point)
+    return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), point)
+
+
+def _ecdsa_verify(public_key_hex: str, signature_hex: str, payload: bytes) -> bool:
+    """
+    Verify an ECDSA signature over a canonical payload (successes are cached)
+
+    Uses libsecp256k1 through coincurve when available and OpenSSL through
+    cryptography otherwise. Successes go into the shared verification cache,
+    keyed by digests rather than the payload itself.
+
+    Args:
+        public_key_hex: Raw x||y public key, hex encoded
+        signature_hex: Raw r||s signature, hex encoded
+        payload: Canonical bytes that were signed
+
+    Returns:
+        True if the signature is valid
+
+    Raises:
+        ValueError / InvalidSignature: If the signature does not verify (not cached)
+    """
+    # Tag with the key, so a cached signature is never accepted for another key
+    cache_tag = f"ecdsa:{public_key_hex}:{signature_hex}"
+    if _lookup_verified(payload, cache_tag) is not None:
+        return True
+
+    vk = _ecdsa_verifying_key(public_key_hex)
+    signature = bytes.fromhex(signature_hex)
+
+    if len(signature) != 64:
+        raise ValueError(f"Expected 64-byte r||s signature, got {len(signature)} bytes")
+    r = int.from_bytes(signature[:32], 'big')
+    s = int.from_bytes(signature[32:], 'big')
+
+    if coincurve is None:
+        # Raises InvalidSignature on failure
+        vk.verify(encode_dss_signature(r, s), payload, ec.ECDSA(hashes.SHA256()))
+    else:
+        # libsecp256k1 rejects high-S signatures; python-ecdsa produces both forms
+        if s > _SECP256K1_ORDER // 2:
+            s = _SECP256K1_ORDER - s
+
+        # coincurve hashes the message with SHA-256 by default
+        if not vk.verify(encode_dss_signature(r, s), payload):
+            raise ValueError("Signature verification failed")
+
+    _remember_verified(payload, cache_tag, {'valid': True})
+    return True
+
+
+def _run_gpg(args: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a single non-interactive gpg command
+
+    All gpg invocations go through here so they share batch mode and
+    captured output.
+
+    Args:
+        args: gpg arguments (without the executable)
+        **kwargs: Extra subprocess.run arguments (input, text, timeout, ...)
+
+    Returns:
+        Completed gpg process
+    """
+    return subprocess.run(['gpg', '--batch'] + list(args), capture_output=True, **kwargs)
+
+
+def _status_validsig(info: Dict, args: bytes) -> None:
+    """VALIDSIG <fingerprint> ...: the signature checked out"""
+    fields = args.split()
+    if fields:
+        info['fingerprint'] = fields[0].decode('ascii', 'replace')
+        info['valid'] = True
+
+
+def _status_goodsig(info: Dict, args: bytes) -> None:
+    """GOODSIG <keyid> <user id>: remember who signed"""
+    parts = args.split(b' ', 1)
+    if len(parts) == 2:
+        info['signer'] = parts[1].decode('utf-8', 'replace')
+
+
+# Status keywords we act on, matched in one pass over gpg's raw output
+_STATUS_RE = re.compile(rb'^\[GNUPG:\] (VALIDSIG|GOODSIG) (.*?)\r?$', re.M)
+_STATUS_HANDLERS = {
+    b'VALIDSIG': _status_validsig,
+    b'GOODSIG': _status_goodsig,
+}
+
+
+def _parse_gpg_status(status: bytes) -> Dict:
+    """
+    Parse gpg --status-fd output from a verification
+
+    Args:
+        status: Raw status lines written by gpg
+
+    Returns:
+        Verification info with 'valid' and, when present, 'fingerprint'/'signer'
+    """
+    info = {'valid': False}
+    # Without VALIDSIG there is nothing to report; skip the regex pass
+    if b'[GNUPG:] VALIDSIG ' not in status:
+        return info
+    for match in _STATUS_RE.finditer(status):
+        _STATUS_HANDLERS[match.group(1)](info, match.group(2))
+    return info
+
+
+# Scratch directory for files handed to gpg, created on first use
+_workdir: Optional[Path] = None
+_workdir_lock = threading.Lock()
+
+
+def _scratch_sig_file() -> Path:
+    """
+    Path for a detached signature handed to gpg by the calling thread
+
+    gpg reads signed data from stdin, but a detached signature must be a
+    file. All calls share one process-wide temporary directory (removed at
+    exit) and overwrite a fixed per-thread file name, instead of creating
+    and removing a directory for every verify.
+
+    Returns:
+        Signature file path
+    """
+    global _workdir
+    if _workdir is None:
+        with _workdir_lock:
+            if _workdir is None:
+                path = tempfile.mkdtemp(prefix='pgp_')
+                atexit.register(shutil.rmtree, path, ignore_errors=True)
+                _workdir = Path(path)
+
+    return _workdir / f"t{threading.get_ident()}.asc"
+
+
+# Successful verifications, keyed by (signature digest, payload digest)
+_VERIFY_CACHE_SIZE = 4096
+_verify_cache: "OrderedDict[Tuple[bytes, bytes], Dict]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _digest(data: bytes) -> bytes:
+    """BLAKE2b-256 digest used for verification cache keys"""
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def _remember_verified(data: bytes, signature: str, info: Dict) -> None:
+    """
+    Record a known-good signature over data in the verification cache
+
+    Args:
+        data: Signed bytes
+        signature: ASCII-armored detached signature (or an "ecdsa:<key>:<sig>" tag)
+        info: Verification info to return on later lookups
+    """
+    key = (_digest(signature.encode('utf-8')), _digest(data))
+    with _verify_cache_lock:
+        _verify_cache[key] = dict(info)
+        _verify_cache.move_to_end(key)
+        if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+
+
+def _lookup_verified(data: bytes, signature: str) -> Optional[Dict]:
+    """
+    Look up a previously verified signature over data
+
+    Args:
+        data: Signed bytes
+        signature: ASCII-armored detached signature (or an "ecdsa:<key>:<sig>" tag)
+
+    Returns:
+        Copy of the cached verification info, or None if not cached
+    """
+    key = (_digest(signature.encode('utf-8')), _digest(data))
+    with _verify_cache_lock:
+        cached = _verify_cache.get(key)
+        if cached is None:
+            return None
+        _verify_cache.move_to_end(key)
+        return dict(cached)
+
+
+# Where the OS exposes pipes as /dev/fd/N, small signatures reach gpg through
+# a pipe instead of the scratch file. The signature is written before gpg
+# starts, so it must fit in the pipe buffer (at least 4 KiB everywhere).
+_DEV_FD = os.name == 'posix' and os.path.isdir('/dev/fd')
+_PIPE_SIG_LIMIT = 4096
+
+
+def _gpg_verify_piped(data: bytes, sig_bytes: bytes) -> subprocess.CompletedProcess:
+    """
+    Run gpg --verify with the signature on an inherited pipe and data on stdin
+
+    Args:
+        data: Signed bytes
+        sig_bytes: ASCII-armored detached signature, at most _PIPE_SIG_LIMIT bytes
+
+    Returns:
+        Completed gpg process
+    """
+    read_fd, write_fd = os.pipe()
+    try:
+        try:
+            os.write(write_fd, sig_bytes)
+        finally:
+            os.close(write_fd)
+        return _run_gpg(
+            ['--verify', '--status-fd', '1', f'/dev/fd/{read_fd}', '-'],
+            input=data, pass_fds=(read_fd,)
+        )
+    finally:
+        os.close(read_fd)
+
+
+def _gpg_verify(data: bytes, signature: str) -> Tuple[bool, Dict]:
+    """
+    Verify a detached ASCII-armored signature over data with gpg
+
+    Successful results are kept in an in-process LRU cache, so re-checking
+    the same signature over the same payload does not run gpg again.
+
+    Args:
+        data: Signed bytes
+        signature: ASCII-armored detached signature
+
+    Returns:
+        (is_valid, verification_info)
+    """
+    cached = _lookup_verified(data, signature)
+    if cached is not None:
+        return True, cached
+
+    # Signed data goes in on stdin ('-'); status lines come back on stdout
+    sig_bytes = signature.encode('utf-8')
+    if _DEV_FD and len(sig_bytes) <= _PIPE_SIG_LIMIT:
+        result = _gpg_verify_piped(data, sig_bytes)
+    else:
+        sig_file = _scratch_sig_file()
+        sig_file.write_bytes(sig_bytes)
+        result = _run_gpg(['--verify', '--status-fd', '1', str(sig_file), '-'], input=data)
+
+    is_valid = result.returncode == 0
+    info = _parse_gpg_status(result.stdout)
+
+    if is_valid:
+        _remember_verified(data, signature, info)
+
+    return is_valid, info
+
+
+@lru_cache(maxsize=64)
+def _pgpy_key(armored_key: str):
+    """Parse an armored public key block with PGPy (cached per block)"""
+    key, _ = pgpy.PGPKey.from_blob(armored_key)
+    return key
+
+
+def _pgpy_verify(data: bytes, signature: str, armored_key: str) -> Optional[Dict]:
+    """
+    Verify a detached signature in-process against a given public key
+
+    Only reports successes: on any failure or parsing problem the caller
+    falls back to gpg, which stays the authority for anything PGPy rejects.
+    PGPy does not check subkey binding signatures, so only signatures made
+    by the primary key are accepted here; subkey signatures go to gpg.
+
+    Args:
+        data: Signed bytes
+        signature: ASCII-armored detached signature
+        armored_key: ASCII-armored public key the entry was signed with
+
+    Returns:
+        Verification info if the signature is valid, else None
+    """
     try:
-        sys.stdout.reconfigure(encoding='utf-8')
-        sys.stderr.reconfigure(encoding='utf-8')
-    except AttributeError:
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+        key = _pgpy_key(armored_key)
+        sig = pgpy.PGPSignature.from_blob(signature)
+        if sig.signer != key.fingerprint.keyid:
+            return None
+        if not key.verify(data, sig):
+            return None
+    except Exception:
+        return None
+
+    info = {'valid': True, 'fingerprint': str(key.fingerprint)}
+    if key.userids:
+        info['signer'] = key.userids[0].userid
+    _remember_verified(data, signature, info)
+    return info
+
+
+# Armored public keys exported from the keyring, by fingerprint (shared by all signers)
+_exported_keys: Dict[str, str] = {}
 
 
 class OpenPGPSigner:
@@ -29,6 +457,9 @@ class OpenPGPSigner:
     Complements existing ECDSA signatures with GPG verification
     """
 
+    # Fingerprints already confirmed present in the keyring (shared by all instances)
+    _known_keys: Set[str] = set()
+
     def __init__(self, fingerprint: str = "AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79"):
         """
         Initialize OpenPGP signer
@@ -38,121 +469,198 @@ class OpenPGPSigner:
         """
         self.fingerprint = fingerprint
         self.key_server = "keys.openpgp.org"
-        self._verify_gpg_available()
+        self._public_key_cache: Optional[str] = None
         self._verify_key_exists()
 
-    def _verify_gpg_available(self):
-        """Verify GPG is installed"""
+    def _verify_key_exists(self):
+        """
+        Verify GPG is installed and the key exists (checked once per fingerprint)
+
+        One --with-colons key listing covers both: it cannot start without
+        gpg, and it reports the key's fingerprints when the keyring has it.
+        """
+        if self.fingerprint in self._known_keys:
+            return
+
         try:
-            result = subprocess.run(
-                ['gpg', '--version'],
-                capture_output=True,
-                timeout=5
+            result = _run_gpg(
+                ['--with-colons', '--fixed-list-mode', '--list-keys', self.fingerprint],
+                timeout=10
             )
-            if result.returncode != 0:
-                raise RuntimeError("GPG not accessible")
         except FileNotFoundError:
             raise RuntimeError(
                 "GPG not found. Install with: choco install gpg (Windows)"
             )
 
-    def _verify_key_exists(self):
-        """Verify the specified key exists"""
-        result = subprocess.run(
-            ['gpg', '--list-keys', self.fingerprint],
-            capture_output=True
-        )
-        if result.returncode != 0:
+        # fpr:::::::::<fingerprint>: for the primary key and each subkey
+        fingerprints = [
+            line.split(b':')[9].decode('ascii')
+            for line in result.stdout.splitlines() if line.startswith(b'fpr:')
+        ]
+        # Fingerprints and key IDs must match a listed key; other selectors
+        # (user IDs, emails) only need gpg to have found something
+        wanted = self.fingerprint.replace(' ', '').upper()
+        if all(c in '0123456789ABCDEF' for c in wanted):
+            found = any(fpr.endswith(wanted) for fpr in fingerprints)
+        else:
+            found = bool(fingerprints)
+
+        if result.returncode != 0 or not found:
             raise RuntimeError(
                 f"Key {self.fingerprint} not found. "
                 f"Import with: gpg --import your_key.asc"
             )
+        self._known_keys.add(self.fingerprint)
 
     def export_public_key(self) -> str:
-        """Export public key in ASCII-armored format"""
-        result = subprocess.run(
-            ['gpg', '--export', '--armor', self.fingerprint],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Key export failed: {result.stderr}")
-        return result.stdout
-
-    def sign_data(self, data: str) -> str:
+        """Export public key in ASCII-armored format (cached per fingerprint)"""
+        if self._public_key_cache is None:
+            armored = _exported_keys.get(self.fingerprint)
+            if armored is None:
+                result = _run_gpg(['--export', '--armor', self.fingerprint])
+                if result.returncode != 0:
+                    raise RuntimeError(f"Key export failed: {result.stderr.decode('utf-8', 'replace')}")
+                armored = result.stdout.decode('utf-8')
+                _exported_keys[self.fingerprint] = armored
+            self._public_key_cache = armored
+        return self._public_key_cache
+
+    def sign_data(self, data: Union[str, bytes]) -> str:
         """
         Create detached GPG signature for data
 
         Args:
-            data: String data to sign (canonical JSON)
+            data: Data to sign (canonical JSON, str or UTF-8 bytes)
 
         Returns:
             ASCII-armored signature
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Write data to temp file
-            data_file = tmp_path / "data.json"
-            data_file.write_text(data, encoding='utf-8')
-
-            sig_file = tmp_path / "data.asc"
-
-            # Sign with GPG
-            result = subprocess.run(
-                ['gpg', '--detach-sign', '--armor', '--output', str(sig_file),
-                 '--local-user', self.fingerprint, str(data_file)],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        # Sign with GPG: data on stdin, signature on stdout
+        result = _run_gpg(
+            ['--detach-sign', '--armor', '--output', '-', '--local-user', self.fingerprint],
+            input=data,
+            timeout=30
+        )
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Signing failed: {result.stderr}")
+        if result.returncode != 0:
+            raise RuntimeError(f"Signing failed: {result.stderr.decode('utf-8', 'replace')}")
 
-            return sig_file.read_text(encoding='utf-8')
+        return result.stdout.decode('utf-8')
 
-    def verify_signature(self, data: str, signature: str) -> Tuple[bool, Dict]:
+    def verify_signature(self, data: Union[str, bytes], signature: str) -> Tuple[bool, Dict]:
         """
         Verify a GPG signature
 
         Args:
-            data: Original data
+            data: Original data (str or UTF-8 bytes)
             signature: ASCII-armored signature
 
         Returns:
             (is_valid, verification_info)
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return _gpg_verify(data, signature)
 
-            data_file = tmp_path / "data.json"
-            data_file.write_text(data, encoding='utf-8')
 
-            sig_file = tmp_path / "data.asc"
-            sig_file.write_text(signature, encoding='utf-8')
+@lru_cache(maxsize=8)
+def _signer(fingerprint: str) -> OpenPGPSigner:
+    """
+    Shared OpenPGPSigner per fingerprint
 
-            # Verify
-            result = subprocess.run(
-                ['gpg', '--verify', '--status-fd', '1', str(sig_file), str(data_file)],
-                capture_output=True,
-                text=True
-            )
+    Reusing the instance keeps its exported public key, so repeated signing
+    with one key exports it from the keyring only once. Construction errors
+    (missing gpg or key) are not cached.
+
+    Args:
+        fingerprint: OpenPGP key fingerprint
+
+    Returns:
+        OpenPGPSigner for the key
+    """
+    return OpenPGPSigner(fingerprint)
+
+
+# Fields added by add_openpgp_signature_batch; never part of the signed payload
+_MERKLE_FIELDS = ('openpgp_merkle_root', 'openpgp_merkle_proof', 'openpgp_leaf_index')
+
+# Everything a signer adds to an entry. Both ECDSA and OpenPGP sign the entry
+# with all of these removed, so either signature can be added or checked
+# regardless of which of the others are already present.
+_SIGNATURE_FIELDS = frozenset(('signature', 'openpgp_signature', 'openpgp_public_key',
+                               'openpgp_fingerprint') + _MERKLE_FIELDS)
 
-            # Parse output
-            info = {'valid': False}
-            for line in result.stdout.split('\n'):
-                if '[GNUPG:] VALIDSIG' in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        info['fingerprint'] = parts[2]
-                        info['valid'] = True
-                elif '[GNUPG:] GOODSIG' in line:
-                    parts = line.split(' ', 3)
-                    if len(parts) >= 4:
-                        info['signer'] = parts[3]
 
-            return result.returncode == 0, info
+def _merkle_leaf(payload: bytes) -> bytes:
+    """Hash a canonical payload into a Merkle leaf (0x00 domain prefix)"""
+    return hashlib.sha256(b'\x00' + payload).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent (0x01 domain prefix)"""
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+
+def _merkle_tree(leaves: List[bytes]) -> Tuple[bytes, List[List[List[str]]]]:
+    """
+    Build a Merkle tree and an inclusion proof for every leaf
+
+    An odd node at the end of a level is carried up unchanged.
+
+    Args:
+        leaves: Leaf hashes, in entry order
+
+    Returns:
+        (root, proofs) where each proof is a list of [side, sibling_hex] pairs
+        from the leaf upwards; side is 'L' or 'R' for the sibling's position
+    """
+    proofs: List[List[List[str]]] = [[] for _ in leaves]
+    # Leaf indices covered by each node of the current level
+    members = [[i] for i in range(len(leaves))]
+    level = list(leaves)
+
+    while len(level) > 1:
+        next_level, next_members = [], []
+        for i in range(0, len(level) - 1, 2):
+            left, right = level[i], level[i + 1]
+            for leaf_index in members[i]:
+                proofs[leaf_index].append(['R', right.hex()])
+            for leaf_index in members[i + 1]:
+                proofs[leaf_index].append(['L', left.hex()])
+            next_level.append(_merkle_node(left, right))
+            next_members.append(members[i] + members[i + 1])
+        if len(level) % 2:
+            next_level.append(level[-1])
+            next_members.append(members[-1])
+        level, members = next_level, next_members
+
+    return level[0], proofs
+
+
+def _merkle_root_from_proof(leaf: bytes, proof: List[List[str]]) -> bytes:
+    """
+    Recompute a Merkle root from a leaf and its inclusion proof
+
+    Args:
+        leaf: Leaf hash
+        proof: [side, sibling_hex] pairs as produced by _merkle_tree
+
+    Returns:
+        Root hash
+    """
+    node = leaf
+    for side, sibling_hex in proof:
+        sibling = bytes.fromhex(sibling_hex)
+        if side == 'L':
+            node = _merkle_node(sibling, node)
+        elif side == 'R':
+            node = _merkle_node(node, sibling)
+        else:
+            raise ValueError(f"Invalid Merkle proof step: {side!r}")
+    return node
 
 
 def add_openpgp_signature(entry: Dict, fingerprint: str = "AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79") -> Dict:
@@ -166,26 +674,93 @@ def add_openpgp_signature(entry: Dict, fingerprint: str = "AC507646E0141D69CC0A1
     Returns:
         Entry with added openpgp_signature field
     """
-    signer = OpenPGPSigner(fingerprint)
+    signer = _signer(fingerprint)
 
     # Create canonical JSON (excluding both signatures)
-    entry_copy = {k: v for k, v in entry.items()
-                  if k not in ['signature', 'openpgp_signature', 'openpgp_public_key']}
-    canonical_data = json.dumps(entry_copy, sort_keys=True, separators=(',', ':'))
+    canonical_data = _canonical(entry, _SIGNATURE_FIELDS)
 
-    # Sign with OpenPGP
+    # Sign with OpenPGP; a signature we just made needs no gpg re-check
     openpgp_sig = signer.sign_data(canonical_data)
+    _remember_verified(canonical_data, openpgp_sig, {'valid': True, 'fingerprint': fingerprint})
 
-    # Add to entry
+    # Add to entry; a previous batch signature's proof no longer applies
+    for field in _MERKLE_FIELDS:
+        entry.pop(field, None)
     entry['openpgp_signature'] = openpgp_sig
     entry['openpgp_public_key'] = signer.export_public_key()
     entry['openpgp_fingerprint'] = fingerprint
 
-    print(f"[OPENPGP] Signature added: {fingerprint[:16]}...")
+    logger.debug("[OPENPGP] Signature added: %s...", fingerprint[:16])
 
     return entry
 
 
+def add_openpgp_signature_batch(entries: List[Dict],
+                                fingerprint: str = "AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79") -> List[Dict]:
+    """
+    Sign many registration entries with a single OpenPGP signature
+
+    Builds a Merkle tree over the entries' canonical payloads and signs only
+    the root, so N entries cost one gpg signature instead of N. Each entry
+    gets the shared signature plus its own inclusion proof; verify with
+    verify_openpgp_signature as usual.
+
+    Args:
+        entries: Registration entry dicts
+        fingerprint: OpenPGP key fingerprint
+
+    Returns:
+        The same entries with signature, Merkle root, proof and leaf index added
+    """
+    if not entries:
+        return entries
+
+    signer = _signer(fingerprint)
+
+    leaves = [_merkle_leaf(_canonical(entry, _SIGNATURE_FIELDS)) for entry in entries]
+    root, proofs = _merkle_tree(leaves)
+    root_hex = root.hex()
+
+    # One signature over the root covers every entry
+    openpgp_sig = signer.sign_data(root_hex)
+    _remember_verified(root_hex.encode('ascii'), openpgp_sig,
+                       {'valid': True, 'fingerprint': fingerprint})
+    public_key = signer.export_public_key()
+
+    for index, (entry, proof) in enumerate(zip(entries, proofs)):
+        entry['openpgp_signature'] = openpgp_sig
+        entry['openpgp_public_key'] = public_key
+        entry['openpgp_fingerprint'] = fingerprint
+        entry['openpgp_merkle_root'] = root_hex
+        entry['openpgp_merkle_proof'] = proof
+        entry['openpgp_leaf_index'] = index
+
+    logger.debug("[OPENPGP] Batch signature added to %d entries: %s...", len(entries), fingerprint[:16])
+
+    return entries
+
+
+# Digests of armored key blocks already imported into the keyring
+_imported_keys: Set[bytes] = set()
+
+
+def _import_public_key(armored_key: str) -> None:
+    """
+    Import an armored public key unless this exact block was already imported
+
+    Args:
+        armored_key: ASCII-armored public key block
+    """
+    key_digest = _digest(armored_key.encode('utf-8'))
+    if key_digest in _imported_keys:
+        return
+
+    result = _run_gpg(['--import'], input=armored_key.encode('utf-8'))
+    # Warnings about already imported keys still exit 0
+    if result.returncode == 0:
+        _imported_keys.add(key_digest)
+
+
 def verify_openpgp_signature(entry: Dict) -> bool:
     """
     Verify OpenPGP signature on a registration entry
@@ -197,62 +772,96 @@ def verify_openpgp_signature(entry: Dict) -> bool:
         True if signature is valid
     """
     if 'openpgp_signature' not in entry:
-        print("[OPENPGP] No OpenPGP signature found")
+        logger.warning("[OPENPGP] No OpenPGP signature found")
         return False
 
-    # Import public key if provided
-    if 'openpgp_public_key' in entry:
-        result = subprocess.run(
-            ['gpg', '--import'],
-            input=entry['openpgp_public_key'],
-            capture_output=True,
-            text=True
-        )
-        # Ignore warnings about already imported keys
-
     # Reconstruct canonical data (must match signing order exactly)
-    entry_copy = {k: v for k, v in entry.items()
-                  if k not in ['signature', 'openpgp_signature', 'openpgp_public_key', 'openpgp_fingerprint']}
-    canonical_data = json.dumps(entry_copy, sort_keys=True, separators=(',', ':'))
-
-    # Direct GPG verification without creating OpenPGPSigner
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-
-        data_file = tmp_path / "data.json"
-        data_file.write_text(canonical_data, encoding='utf-8')
-
-        sig_file = tmp_path / "data.asc"
-        sig_file.write_text(entry['openpgp_signature'], encoding='utf-8')
+    canonical_data = _canonical(entry, _SIGNATURE_FIELDS)
 
-        # Verify
-        result = subprocess.run(
-            ['gpg', '--verify', '--status-fd', '1', str(sig_file), str(data_file)],
-            capture_output=True,
-            text=True
-        )
+    # Batch-signed entries: the signature covers the Merkle root, which is
+    # recomputed from this entry's payload and inclusion proof
+    if 'openpgp_merkle_proof' in entry:
+        try:
+            root_hex = _merkle_root_from_proof(
+                _merkle_leaf(canonical_data), entry['openpgp_merkle_proof']
+            ).hex()
+        except (TypeError, ValueError) as e:
+            logger.warning("[OPENPGP VERIFY] ❌ Malformed Merkle proof: %s", e)
+            return False
+        if root_hex != entry.get('openpgp_merkle_root', root_hex):
+            logger.warning("[OPENPGP VERIFY] ❌ Merkle root mismatch")
+            return False
+        canonical_data = root_hex.encode('ascii')
+
+    signature = entry['openpgp_signature']
+    public_key = entry.get('openpgp_public_key')
+
+    # Cached result, then PGPy in-process against the embedded key, then gpg
+    info = _lookup_verified(canonical_data, signature)
+    if info is None and pgpy is not None and public_key:
+        info = _pgpy_verify(canonical_data, signature, public_key)
+
+    if info is not None:
+        is_valid = True
+    else:
+        # Import public key if provided (once per distinct key block)
+        if public_key:
+            _import_public_key(public_key)
+        is_valid, info = _gpg_verify(canonical_data, signature)
+
+    if is_valid:
+        signer = info.get('signer') or info.get('fingerprint', 'Unknown')
+        logger.debug("[OPENPGP VERIFY] ✅ Valid signature from %s", signer)
+    else:
+        logger.warning("[OPENPGP VERIFY] ❌ Invalid signature")
+
+    return is_valid
+
+
+def verify_many(entries: List[Dict], max_workers: Optional[int] = None) -> List[bool]:
+    """
+    Verify OpenPGP signatures on many entries concurrently
 
-        # Parse output
-        info = {'valid': False}
-        for line in result.stdout.split('\n'):
-            if '[GNUPG:] VALIDSIG' in line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    info['fingerprint'] = parts[2]
-                    info['valid'] = True
-            elif '[GNUPG:] GOODSIG' in line:
-                parts = line.split(' ', 3)
-                if len(parts) >= 4:
-                    info['signer'] = parts[3]
-
-        is_valid = result.returncode == 0
+    Each check that misses the verification cache is a gpg subprocess, so
+    worker threads overlap them instead of waiting on one at a time.
+    Entries of one signed batch share a root and signature: one entry per
+    batch is checked first, so the rest of the batch are cache hits rather
+    than concurrent runs of the same check.
 
-        if is_valid:
-            print(f"[OPENPGP VERIFY] ✅ Valid signature from {info.get('signer', 'Unknown')}")
-        else:
-            print(f"[OPENPGP VERIFY] ❌ Invalid signature")
+    Args:
+        entries: Registration entries with openpgp_signature
+        max_workers: Thread pool size (ThreadPoolExecutor's default if None)
 
-        return is_valid
+    Returns:
+        One validity flag per entry, in input order
+    """
+    def verify_one(entry: Dict) -> bool:
+        try:
+            return verify_openpgp_signature(entry)
+        except Exception as e:
+            logger.warning("[OPENPGP VERIFY] ❌ Verification error: %s", e)
+            return False
+
+    if len(entries) < 2:
+        return [verify_one(entry) for entry in entries]
+
+    # (signature, root) -> indices of the entries in that batch
+    batches: Dict[Tuple[str, str], List[int]] = {}
+    for i, entry in enumerate(entries):
+        signature = entry.get('openpgp_signature')
+        root = entry.get('openpgp_merkle_root')
+        if isinstance(signature, str) and isinstance(root, str):
+            batches.setdefault((signature, root), []).append(i)
+    first = [indices[0] for indices in batches.values() if len(indices) > 1]
+    first_set = set(first)
+    rest = [i for i in range(len(entries)) if i not in first_set]
+
+    results: List[bool] = [False] * len(entries)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for phase in (first, rest):
+            for i, is_valid in zip(phase, executor.map(verify_one, [entries[i] for i in phase])):
+                results[i] = is_valid
+    return results
 
 
 # Convenience function for mainscript integration
@@ -283,17 +892,13 @@ def verify_dual_signatures(entry: Dict) -> Tuple[bool, bool]:
     # ECDSA verification (from mainscript's verify_registration method)
     ecdsa_valid = False
     try:
-        import ecdsa
-        from ecdsa import SECP256k1
-        ser = json.dumps({k: v for k, v in entry.items()
-                         if k not in ['signature', 'openpgp_signature', 'openpgp_public_key']},
-                        sort_keys=True).encode()
-        vk = ecdsa.VerifyingKey.from_string(bytes.fromhex(entry['public_key']), curve=SECP256k1)
-        vk.verify(bytes.fromhex(entry['signature']), ser, hashfunc=hashlib.sha256)
-        ecdsa_valid = True
-        print("[ECDSA VERIFY] ✅ Valid")
+        # Same fields as the OpenPGP payload, but with json.dumps' default
+        # separators, so the bytes themselves cannot be shared
+        ser = _canonical(entry, _SIGNATURE_FIELDS, separators=(', ', ': '))
+        ecdsa_valid = _ecdsa_verify(entry['public_key'], entry['signature'], ser)
+        logger.debug("[ECDSA VERIFY] ✅ Valid")
     except Exception as e:
-        print(f"[ECDSA VERIFY] ❌ Invalid: {e}")
+        logger.warning("[ECDSA VERIFY] ❌ Invalid: %s", e)
 
     # OpenPGP verification
     openpgp_valid = verify_openpgp_signature(entry)
@@ -302,6 +907,8 @@ def verify_dual_signatures(entry: Dict) -> Tuple[bool, bool]:
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
+
     print("=" * 70)
     print("Governance Crypto - OpenPGP Integration Test")
     print("=" * 70)
@@ -319,6 +926,9 @@ if __name__ == '__main__':
         print("✅ Signing successful")
 
         print("\n2. Testing OpenPGP verification...")
+        # Signing cached its own result; check the signature for real
+        with _verify_cache_lock:
+            _verify_cache.clear()
         is_valid = verify_openpgp_signature(signed_entry)
         if is_valid:
             print("✅ Verification successful")
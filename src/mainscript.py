@@ -6,16 +6,223 @@ Provides PublicRegistrar for cryptographic identity verification and governance
 
 import argparse
 import json
+import logging
+import math
 import os
+import re
 import sys
 import time
 import hashlib
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from functools import wraps, lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple
+from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import _win_console
 
 # Import governance crypto module
-from governance_crypto import verify_openpgp_signature, OpenPGPSigner
+from governance_crypto import verify_openpgp_signature, verify_many, OpenPGPSigner
+
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Directories this process has already created (or found existing)
+_KNOWN_DIRS: Set[str] = set()
+
+# Parsed registrations kept per PublicRegistrar
+_REGISTRATION_CACHE_SIZE = 128
+
+# Seconds a failed verify_identity is remembered before it is retried
+_FAILED_CACHE_TTL = 30.0
+
+# Directory mtimes this recent (ns) are not trusted to detect later changes
+_INDEX_MTIME_SLACK_NS = 2_000_000_000
+
+# Digit runs long enough to hold an integer orjson cannot represent exactly
+_LONG_DIGITS = re.compile(r'\d{19,}')
+_LONG_DIGITS_BYTES = re.compile(rb'\d{19,}')
+
+
+def _loads(data: Any) -> Any:
+    """
+    Parse JSON text or bytes, using orjson when it is installed
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Parsed JSON value
+    """
+    # orjson turns integers outside the 64-bit range into floats, which
+    # would change signed content; any run of 19+ digits goes to the stdlib
+    long_digits = _LONG_DIGITS if isinstance(data, str) else _LONG_DIGITS_BYTES
+    if orjson is not None and not long_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, Infinity); let the stdlib parser
+            # accept those or raise its usual error
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """True if value contains a NaN or infinite float at any depth"""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _dumps_pretty(data: Any) -> bytes:
+    """
+    Serialize to indented JSON bytes for writing to disk, using orjson when installed
+
+    Args:
+        data: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON, indented by two spaces
+    """
+    # orjson writes NaN/Infinity as null, which would change signed content
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those
+            pass
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory (and parents) at most once per process
+
+    Args:
+        path: Directory to create
+    """
+    # Absolute, so a relative path still names the same directory after os.chdir
+    key = os.path.abspath(path)
+    if key in _KNOWN_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(key)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write a file into a directory created by _ensure_dir
+
+    Args:
+        path: File to write
+        data: File content
+    """
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        # The directory was removed after it was created; make it again
+        _KNOWN_DIRS.discard(os.path.abspath(path.parent))
+        _ensure_dir(path.parent)
+        path.write_bytes(data)
+
+
+def _fingerprint_key(fingerprint: str) -> str:
+    """
+    Normalize a fingerprint for cache keys, the verified store and file names
+
+    Args:
+        fingerprint: OpenPGP fingerprint in any case
+
+    Returns:
+        Upper-case fingerprint
+    """
+    return fingerprint.upper()
+
+
+def _registration_digest(registration: Dict) -> str:
+    """SHA-256 over a registration's full content, signatures included"""
+    return hashlib.sha256(json.dumps(registration, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class _VerifiedStore:
+    """
+    SQLite record of registrations that passed verification
+
+    Lets a new process (e.g. another CLI run) accept an identity it already
+    verified without running gpg again. Entries are keyed by fingerprint and
+    a digest of the registration content, so an edited registration is
+    verified afresh.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the store
+
+        Args:
+            path: SQLite database file
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialized
+        """
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS verified ("
+                "fingerprint TEXT PRIMARY KEY, reg_digest TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+
+    def is_verified(self, fingerprint: str, registration: Dict) -> bool:
+        """
+        Check whether this exact registration was verified before
+
+        Args:
+            fingerprint: OpenPGP fingerprint
+            registration: Registration entry as currently loaded
+
+        Returns:
+            True if the stored digest matches the registration
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT 1 FROM verified WHERE fingerprint = ? AND reg_digest = ?",
+                    (fingerprint, _registration_digest(registration))
+                ).fetchone()
+        except sqlite3.Error as e:
+            # e.g. a corrupt or locked database; verify as if nothing was stored
+            logger.warning("[CACHE] Verification cache lookup failed: %s", e)
+            return False
+        return row is not None
+
+    def record(self, verified: Dict[str, Dict]) -> None:
+        """
+        Remember registrations that just passed verification
+
+        Args:
+            verified: Fingerprint -> verified registration entry
+        """
+        now = int(time.time())
+        rows = [(fp, _registration_digest(reg), now) for fp, reg in verified.items()]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO verified (fingerprint, reg_digest, ts) VALUES (?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            # The verifications themselves succeeded; only the record is lost
+            logger.warning("[CACHE] Failed to record verified identities: %s", e)
 
 
 class PublicRegistrar:
@@ -24,70 +231,202 @@ class PublicRegistrar:
     Manages cryptographic identity verification and governance operations
     """
 
-    def __init__(self, reg_dir: str = './registrations/examples'):
+    def __init__(self, reg_dir: str = './registrations/examples', cache_db: Optional[str] = None):
         """
         Initialize PublicRegistrar
 
         Args:
             reg_dir: Directory containing registration files
+            cache_db: Optional SQLite file that keeps verified identities across runs
         """
         self.reg_dir = Path(reg_dir)
-        self.reg_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.reg_dir)
+        self._store = None
+        if cache_db:
+            try:
+                self._store = _VerifiedStore(cache_db)
+            except sqlite3.Error as e:
+                logger.warning("[CACHE] Verification cache %s unavailable, continuing without it: %s",
+                               cache_db, e)
         self._verified_cache: Dict[str, Dict[str, Any]] = {}
+        # Fingerprints that recently failed verification -> monotonic time of failure
+        self._failed_cache: Dict[str, float] = {}
+        # Fingerprint -> (file mtime/size, parsed registration); the lock is
+        # only held for dict operations, never across file reads
+        self._registration_cache: "OrderedDict[str, Tuple[Optional[Tuple[int, int]], Dict]]" = OrderedDict()
+        self._registration_lock = threading.Lock()
+        # Fingerprint -> registration file, rebuilt when the directory's mtime changes
+        self._index: Dict[str, Path] = {}
+        self._index_mtime: Optional[int] = None
+        self._index_lock = threading.Lock()
+
+    def _registration_index(self) -> Dict[str, Path]:
+        """
+        Map fingerprints to registration files in reg_dir
+
+        The directory is rescanned only when its mtime changes, so an
+        unchanged directory costs one stat instead of a listing (and no
+        per-file existence checks).
+
+        Returns:
+            Dict of normalized fingerprint -> registration file path
+        """
+        try:
+            mtime = os.stat(self.reg_dir).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        with self._index_lock:
+            if mtime != self._index_mtime:
+                index = {}
+                with os.scandir(self.reg_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not (name.startswith("reg_") and name.endswith(".json")):
+                            continue
+                        stem = name[len("reg_"):-len(".json")]
+                        fingerprint = _fingerprint_key(stem)
+                        if fingerprint in index:
+                            # reg_abc.json next to reg_ABC.json: the normalized
+                            # name is the one register_member writes
+                            logger.warning("[WARNING] Duplicate registration files for %s", fingerprint)
+                            if stem != fingerprint:
+                                continue
+                        index[fingerprint] = Path(entry.path)
+                self._index = index
+                # A file added within the filesystem's mtime granularity of
+                # this scan might not bump the mtime again; rescan next time
+                recent = time.time_ns() - mtime < _INDEX_MTIME_SLACK_NS
+                self._index_mtime = None if recent else mtime
+            return self._index
 
-    @lru_cache(maxsize=128)
     def _load_registration(self, fingerprint: str) -> Optional[Dict]:
         """
-        Load a registration file by fingerprint (cached)
+        Load a registration file by fingerprint (cached per registrar)
+
+        Cached parses are keyed on the file's mtime and size, so a file
+        rewritten in place is parsed again. Only successful loads are
+        cached, so a registration that appears later is picked up on the
+        next call.
 
         Args:
-            fingerprint: OpenPGP fingerprint
+            fingerprint: Normalized OpenPGP fingerprint
 
         Returns:
             Registration dict or None if not found
         """
-        reg_file = self.reg_dir / f"reg_{fingerprint}.json"
-        if not reg_file.exists():
+        reg_file = self._registration_index().get(fingerprint)
+        if reg_file is None:
             return None
 
         try:
-            with open(reg_file, 'r') as f:
-                return json.load(f)
+            file_key = self._file_key(reg_file)
+        except FileNotFoundError:
+            return None
+
+        with self._registration_lock:
+            cached = self._registration_cache.get(fingerprint)
+            if cached is not None and file_key is not None and cached[0] == file_key:
+                self._registration_cache.move_to_end(fingerprint)
+                return cached[1]
+
+        try:
+            # Parse the raw bytes: no text decoding pass before the parser
+            registration = _loads(reg_file.read_bytes())
         except Exception as e:
-            print(f"[ERROR] Failed to load registration: {e}")
+            logger.error("[ERROR] Failed to load registration: %s", e)
+            return None
+        if not isinstance(registration, dict):
+            logger.error("[ERROR] Failed to load registration: %s is not a JSON object", reg_file.name)
             return None
 
+        self._cache_registration(fingerprint, registration, file_key)
+        return registration
+
+    @staticmethod
+    def _file_key(reg_file: Path) -> Optional[Tuple[int, int]]:
+        """
+        Identify the current content of a registration file
+
+        Args:
+            reg_file: Registration file path
+
+        Returns:
+            (st_mtime_ns, st_size), or None if the file changed too recently
+            for its mtime to reveal a later rewrite
+        """
+        st = os.stat(reg_file)
+        if time.time_ns() - st.st_mtime_ns < _INDEX_MTIME_SLACK_NS:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _cache_registration(self, fingerprint: str, registration: Dict,
+                            file_key: Optional[Tuple[int, int]]) -> None:
+        """
+        Insert a parsed registration into the per-registrar LRU cache
+
+        Args:
+            fingerprint: Normalized OpenPGP fingerprint
+            registration: Parsed registration entry
+            file_key: _file_key() of the file it was read from (None is never a hit)
+        """
+        with self._registration_lock:
+            self._registration_cache[fingerprint] = (file_key, registration)
+            self._registration_cache.move_to_end(fingerprint)
+            if len(self._registration_cache) > _REGISTRATION_CACHE_SIZE:
+                self._registration_cache.popitem(last=False)
+
     def verify_identity(self, fingerprint: str) -> bool:
         """
         Verify an identity by OpenPGP fingerprint
 
         Args:
-            fingerprint: OpenPGP fingerprint to verify
+            fingerprint: OpenPGP fingerprint to verify (any case)
 
         Returns:
             True if identity is cryptographically verified
         """
-        # Check cache first
+        fingerprint = _fingerprint_key(fingerprint)
+
+        # Check caches first
         if fingerprint in self._verified_cache:
-            print(f"[CACHE HIT] Identity {fingerprint[:16]}... already verified")
+            logger.debug("[CACHE HIT] Identity %s... already verified", fingerprint[:16])
             return True
 
+        failed_at = self._failed_cache.get(fingerprint)
+        if failed_at is not None and time.monotonic() - failed_at < _FAILED_CACHE_TTL:
+            logger.debug("[CACHE HIT] Identity %s... recently failed verification", fingerprint[:16])
+            return False
+
         # Load registration
         registration = self._load_registration(fingerprint)
         if not registration:
-            print(f"[VERIFY FAIL] No registration found for {fingerprint}")
+            # Not remembered: no gpg ran, and a registration written later
+            # (by another registrar or process) must be found straight away
+            logger.warning("[VERIFY FAIL] No registration found for %s", fingerprint)
             return False
 
+        # Verified by an earlier run against this exact registration content
+        if self._store is not None and self._store.is_verified(fingerprint, registration):
+            self._verified_cache[fingerprint] = registration
+            self._failed_cache.pop(fingerprint, None)
+            logger.debug("[CACHE HIT] Identity %s... verified in an earlier run", fingerprint[:16])
+            return True
+
         # Verify OpenPGP signature
         is_valid = verify_openpgp_signature(registration)
 
         if is_valid:
             # Cache the verified identity
             self._verified_cache[fingerprint] = registration
-            print(f"[VERIFY SUCCESS] Identity {fingerprint[:16]}... verified and cached")
+            self._failed_cache.pop(fingerprint, None)
+            if self._store is not None:
+                self._store.record({fingerprint: registration})
+            logger.info("[VERIFY SUCCESS] Identity %s... verified and cached", fingerprint[:16])
             return True
         else:
-            print(f"[VERIFY FAIL] Signature verification failed for {fingerprint}")
+            self._failed_cache[fingerprint] = time.monotonic()
+            logger.warning("[VERIFY FAIL] Signature verification failed for %s", fingerprint)
             return False
 
     def list_members(self) -> List[Dict[str, str]]:
@@ -98,31 +437,67 @@ class PublicRegistrar:
             List of member info dicts
         """
         members = []
-
-        # Scan registration directory
-        for reg_file in self.reg_dir.glob("reg_*.json"):
-            try:
-                with open(reg_file, 'r') as f:
-                    registration = json.load(f)
-
-                # Extract member info
-                member_info = {
-                    'proof_name': registration.get('proof_name', 'Unknown'),
-                    'openpgp_fingerprint': registration.get('openpgp_fingerprint', ''),
-                    'timestamp': registration.get('timestamp', 0),
-                    'file': str(reg_file.name)
-                }
-
-                # Verify signature
-                if verify_openpgp_signature(registration):
-                    member_info['verified'] = True
-                    members.append(member_info)
-                else:
-                    member_info['verified'] = False
-                    print(f"[WARNING] Member {member_info['proof_name']} has invalid signature")
-
-            except Exception as e:
-                print(f"[ERROR] Failed to process {reg_file}: {e}")
+        registrations = []
+
+        # Scan registration directory - loads go through the registration
+        # cache, so repeated listings and verify_identity share one parse
+        index = self._registration_index()
+        fingerprints = list(index)
+        reg_files = [index[fp] for fp in fingerprints]
+
+        # File reads release the GIL, so uncached loads overlap on a thread pool
+        if len(reg_files) > 1:
+            with ThreadPoolExecutor() as executor:
+                loaded = list(executor.map(self._load_registration, fingerprints))
+        else:
+            loaded = [self._load_registration(fp) for fp in fingerprints]
+
+        for fingerprint, reg_file, registration in zip(fingerprints, reg_files, loaded):
+            if registration is not None:
+                registrations.append((fingerprint, reg_file, registration))
+
+        if not registrations:
+            return members
+
+        # Skip registrations an earlier run already verified, then verify
+        # the rest concurrently (one gpg subprocess per uncached check)
+        results = [
+            self._store is not None and
+            self._store.is_verified(fingerprint, registration)
+            for fingerprint, _, registration in registrations
+        ]
+        pending = [i for i, known in enumerate(results) if not known]
+        newly_verified = {}
+        for i, is_valid in zip(pending, verify_many([registrations[i][2] for i in pending])):
+            results[i] = is_valid
+            if is_valid:
+                fingerprint, _, registration = registrations[i]
+                newly_verified[fingerprint] = registration
+
+        for (fingerprint, reg_file, registration), is_valid in zip(registrations, results):
+            # Extract member info
+            member_info = {
+                'proof_name': registration.get('proof_name', 'Unknown'),
+                'openpgp_fingerprint': registration.get('openpgp_fingerprint', ''),
+                'timestamp': registration.get('timestamp', 0),
+                'file': str(reg_file.name)
+            }
+
+            if is_valid:
+                member_info['verified'] = True
+                members.append(member_info)
+                # Later verify_identity calls for this member skip gpg
+                self._verified_cache[fingerprint] = registration
+                self._failed_cache.pop(fingerprint, None)
+            else:
+                member_info['verified'] = False
+                # The file may have changed since verify_identity accepted it
+                self._verified_cache.pop(fingerprint, None)
+                logger.warning("[WARNING] Member %s has invalid signature", member_info['proof_name'])
+
+        # Rows already in the store are left as they are
+        if self._store is not None and newly_verified:
+            self._store.record(newly_verified)
 
         return members
 
@@ -137,25 +512,66 @@ class PublicRegistrar:
         Returns:
             True if registration successful
         """
+        fingerprint = _fingerprint_key(fingerprint)
+
         # Verify signature first
         if not verify_openpgp_signature(registration_data):
-            print("[REGISTER FAIL] Invalid signature - cannot register")
+            logger.warning("[REGISTER FAIL] Invalid signature - cannot register")
             return False
 
         # Save registration file
         reg_file = self.reg_dir / f"reg_{fingerprint}.json"
 
         try:
-            with open(reg_file, 'w') as f:
-                json.dump(registration_data, f, indent=2)
-
-            print(f"[REGISTER SUCCESS] Member registered: {reg_file}")
+            # One buffer, one write
+            _write_file(reg_file, _dumps_pretty(registration_data))
+
+            # The signature was just verified - reuse that result instead of
+            # re-running gpg on the next verify_identity, and replace any
+            # stale cached load of this fingerprint
+            self._cache_registration(fingerprint, registration_data, self._file_key(reg_file))
+            self._verified_cache[fingerprint] = registration_data
+            self._failed_cache.pop(fingerprint, None)
+            if self._store is not None:
+                self._store.record({fingerprint: registration_data})
+
+            logger.info("[REGISTER SUCCESS] Member registered: %s", reg_file)
             return True
 
         except Exception as e:
-            print(f"[REGISTER FAIL] Failed to save registration: {e}")
+            logger.error("[REGISTER FAIL] Failed to save registration: %s", e)
             return False
 
+    def register_members(self, registrations: List[Dict]) -> int:
+        """
+        Register a batch of members, verifying their signatures concurrently
+
+        A malformed entry, or an error while handling one, counts as a
+        failed registration; the rest of the batch is still registered.
+
+        Args:
+            registrations: Registration entries, each carrying openpgp_fingerprint
+
+        Returns:
+            Number of members registered successfully
+        """
+        def register_one(registration: Dict) -> bool:
+            if not isinstance(registration, dict):
+                logger.warning("[REGISTER FAIL] Registration entry is not a JSON object")
+                return False
+            fingerprint = registration.get('openpgp_fingerprint')
+            if not fingerprint or not isinstance(fingerprint, str):
+                logger.warning("[REGISTER FAIL] No fingerprint in registration entry")
+                return False
+            try:
+                return self.register_member(registration, fingerprint)
+            except Exception as e:
+                logger.error("[REGISTER FAIL] Failed to register %s: %s", fingerprint, e)
+                return False
+
+        with ThreadPoolExecutor() as executor:
+            return sum(executor.map(register_one, registrations))
+
     def submit_proposal(self, proposal: Dict, fingerprint: str) -> Optional[Dict]:
         """
         Submit a governance proposal (requires verified identity)
@@ -167,14 +583,16 @@ class PublicRegistrar:
         Returns:
             Proposal metadata if successful, None otherwise
         """
+        fingerprint = _fingerprint_key(fingerprint)
+
         # Verify identity first
         if not self.verify_identity(fingerprint):
-            print("[PROPOSAL FAIL] Identity not verified - cannot submit proposal")
+            logger.warning("[PROPOSAL FAIL] Identity not verified - cannot submit proposal")
             return None
 
         # Create proposal file
         proposals_dir = Path('./governance/proposals')
-        proposals_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(proposals_dir)
 
         proposal_id = hashlib.sha256(
             json.dumps(proposal, sort_keys=True).encode()
@@ -190,14 +608,14 @@ class PublicRegistrar:
         proposal_file = proposals_dir / f"proposal_{proposal_id}.json"
 
         try:
-            with open(proposal_file, 'w') as f:
-                json.dump(proposal_data, f, indent=2)
+            # One buffer, one write
+            _write_file(proposal_file, _dumps_pretty(proposal_data))
 
-            print(f"[PROPOSAL SUCCESS] Proposal {proposal_id} submitted")
+            logger.info("[PROPOSAL SUCCESS] Proposal %s submitted", proposal_id)
             return proposal_data
 
         except Exception as e:
-            print(f"[PROPOSAL FAIL] Failed to save proposal: {e}")
+            logger.error("[PROPOSAL FAIL] Failed to save proposal: %s", e)
             return None
 
 
@@ -226,7 +644,7 @@ def require_verified_identity(fingerprint: str):
 
 def main(args):
     """Main CLI interface"""
-    registrar = PublicRegistrar(reg_dir=args.reg_dir)
+    registrar = PublicRegistrar(reg_dir=args.reg_dir, cache_db=args.cache_db)
 
     if args.list_members:
         print("=" * 70)
@@ -252,7 +670,7 @@ def main(args):
         print(f"Registering member from file: {args.register_member}")
         try:
             with open(args.register_member, 'r') as f:
-                registration = json.load(f)
+                registration = _loads(f.read())
 
             fingerprint = registration.get('openpgp_fingerprint')
             if not fingerprint:
@@ -266,11 +684,34 @@ def main(args):
             print(f"[ERROR] Failed to register member: {e}")
             sys.exit(1)
 
+    elif args.register_batch:
+        print(f"Registering members from batch file: {args.register_batch}")
+        try:
+            registrations = []
+            with open(args.register_batch, 'r') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        registrations.append(_loads(line))
+                    except ValueError as e:
+                        # Counted as a failed registration, like other bad entries
+                        logger.warning("[REGISTER FAIL] Line %d is not valid JSON: %s", line_no, e)
+                        registrations.append(None)
+
+            registered = registrar.register_members(registrations)
+            print(f"Registered {registered}/{len(registrations)} member(s)")
+            sys.exit(0 if registered == len(registrations) else 1)
+
+        except Exception as e:
+            print(f"[ERROR] Failed to register batch: {e}")
+            sys.exit(1)
+
     elif args.submit_proposal:
         print(f"Submitting proposal from file: {args.submit_proposal}")
         try:
             with open(args.submit_proposal, 'r') as f:
-                proposal = json.load(f)
+                proposal = _loads(f.read())
 
             if not args.fingerprint:
                 print("[ERROR] --fingerprint required for proposal submission")
@@ -289,6 +730,9 @@ def main(args):
 
 
 if __name__ == "__main__":
+    # Fix Windows console encoding
+    _win_console.configure()
+
     parser = argparse.ArgumentParser(
         description="Universal Governance - Cryptographic Identity Verification"
     )
@@ -300,6 +744,13 @@ if __name__ == "__main__":
         help='Directory containing registration files'
     )
 
+    parser.add_argument(
+        '--cache-db',
+        type=str,
+        metavar='FILE',
+        help='SQLite file that remembers verified identities between runs'
+    )
+
     parser.add_argument(
         '--list-members',
         action='store_true',
@@ -320,6 +771,13 @@ if __name__ == "__main__":
         help='Register a new member from JSON file'
     )
 
+    parser.add_argument(
+        '--register-batch',
+        type=str,
+        metavar='FILE',
+        help='Register many members from a JSON Lines file (one registration per line)'
+    )
+
     parser.add_argument(
         '--submit-proposal',
         type=str,
@@ -333,5 +791,16 @@ if __name__ == "__main__":
         help='Your OpenPGP fingerprint (for proposal submission)'
     )
 
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show per-signature verification details'
+    )
+
     args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
     main(args)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Unit tests for governance_crypto helpers that do not need a GPG secret key
+"""
+
+import sys
+import json
+import time
+import hashlib
+
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import governance_crypto
+from governance_crypto import (
+    _canonical, _merkle_leaf, _merkle_tree, _merkle_root_from_proof, verify_openpgp_signature,
+    verify_many, verify_dual_signatures, add_openpgp_signature, add_openpgp_signature_batch
+)
+
+REG_FILE = (Path(__file__).parent.parent / 'registrations' / 'examples' /
+            'reg_AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79.json')
+
+SIGNATURE_FIELDS = ['signature', 'openpgp_signature', 'openpgp_public_key', 'openpgp_fingerprint']
+
+
+def _reference(entry, exclude):
+    """Canonical form as originally produced with json.dumps"""
+    payload = {k: v for k, v in entry.items() if k not in exclude}
+    return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def test_canonical_matches_json_dumps():
+    """Specialized registration encoder must be byte-identical to json.dumps"""
+    with open(REG_FILE, 'r') as f:
+        registration = json.load(f)
+
+    assert _canonical(registration, SIGNATURE_FIELDS) == _reference(registration, SIGNATURE_FIELDS)
+
+    awkward_values = ['é "\\\x7f\x01', 10 ** 30, True, None, 1e-7, 2.5, [], {'z': 1, 'a': ['ü']}]
+    for key in ('proof_name', 'timestamp', 'proof_data'):
+        for value in awkward_values:
+            entry = dict(registration, **{key: value})
+            assert _canonical(entry, SIGNATURE_FIELDS) == _reference(entry, SIGNATURE_FIELDS), (key, value)
+
+
+def test_canonical_generic_fallback():
+    """Payloads outside the known schemas use the generic encoder"""
+    entry = {'b': 1, 'a': {'y': 2, 'x': [1, 'two']}, 'signature': 'ff'}
+    assert _canonical(entry, ['signature']) == b'{"a":{"x":[1,"two"],"y":2},"b":1}'
+    assert _canonical(entry, ['signature'], separators=(', ', ': ')) == \
+        b'{"a": {"x": [1, "two"], "y": 2}, "b": 1}'
+
+
+def test_repeat_verification_skips_gpg(monkeypatch):
+    """A verified entry is not re-imported or re-checked by gpg in this process"""
+    with open(REG_FILE, 'r') as f:
+        registration = json.load(f)
+
+    assert verify_openpgp_signature(registration)
+
+    calls = []
+    real_run_gpg = governance_crypto._run_gpg
+
+    def counting_run_gpg(args, **kwargs):
+        calls.append(args[0])
+        return real_run_gpg(args, **kwargs)
+
+    monkeypatch.setattr(governance_crypto, '_run_gpg', counting_run_gpg)
+
+    assert verify_openpgp_signature(registration)
+    assert calls == [], f"gpg re-run on cached verification: {calls}"
+
+
+def test_merkle_proofs_rebuild_root():
+    """Every leaf's inclusion proof leads back to the batch root"""
+    for size in range(1, 10):
+        leaves = [_merkle_leaf(b'entry %d' % i) for i in range(size)]
+        root, proofs = _merkle_tree(leaves)
+
+        for leaf, proof in zip(leaves, proofs):
+            assert _merkle_root_from_proof(leaf, proof) == root
+
+        # A proof does not fit another leaf
+        if size > 1:
+            assert _merkle_root_from_proof(leaves[0], proofs[1]) != root
+
+
+def test_verify_many_keeps_input_order():
+    """Concurrent verification reports each entry's own result, in order"""
+    with open(REG_FILE, 'r') as f:
+        registration = json.load(f)
+
+    tampered = dict(registration, proof_name='someone_else')
+    unsigned = {'proof_name': 'unsigned'}
+
+    assert verify_many([registration, tampered, unsigned, registration]) == [True, False, False, True]
+    assert verify_many([]) == []
+
+
+def test_verify_many_checks_batch_signature_once(monkeypatch):
+    """Entries sharing a batch signature cost one signature check, not one each"""
+    entries = [{'proof_name': f'member_{i}', 'timestamp': i} for i in range(16)]
+    root, proofs = _merkle_tree([_merkle_leaf(_canonical(e, SIGNATURE_FIELDS)) for e in entries])
+    for entry, proof in zip(entries, proofs):
+        entry.update(openpgp_signature='batch signature', openpgp_merkle_root=root.hex(),
+                     openpgp_merkle_proof=proof)
+
+    calls = []
+
+    def fake_gpg_verify(data, signature):
+        calls.append(data)
+        time.sleep(0.01)
+        governance_crypto._remember_verified(data, signature, {'valid': True})
+        return True, {'valid': True}
+
+    monkeypatch.setattr(governance_crypto, '_gpg_verify', fake_gpg_verify)
+    monkeypatch.setattr(governance_crypto, '_verify_cache', governance_crypto.OrderedDict())
+
+    assert verify_many(entries, max_workers=8) == [True] * len(entries)
+    assert calls == [root.hex().encode('ascii')]
+
+
+class _FakeSigner:
+    """Signer whose 'signature' is a digest of the signed data"""
+
+    def sign_data(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return 'fake:' + hashlib.sha256(data).hexdigest()
+
+    def export_public_key(self):
+        return 'fake public key'
+
+
+def test_resign_batch_entry_individually(monkeypatch):
+    """An entry re-signed on its own drops its old batch proof and still verifies"""
+    signer = _FakeSigner()
+
+    def fake_gpg_verify(data, signature):
+        return signature == signer.sign_data(data), {'valid': True}
+
+    monkeypatch.setattr(governance_crypto, '_signer', lambda fingerprint: signer)
+    monkeypatch.setattr(governance_crypto, '_gpg_verify', fake_gpg_verify)
+    monkeypatch.setattr(governance_crypto, '_import_public_key', lambda armored_key: None)
+    monkeypatch.setattr(governance_crypto, 'pgpy', None)
+    monkeypatch.setattr(governance_crypto, '_verify_cache', governance_crypto.OrderedDict())
+
+    entries = add_openpgp_signature_batch([{'proof_name': f'member_{i}'} for i in range(3)])
+    assert verify_many(entries) == [True, True, True]
+
+    add_openpgp_signature(entries[1])
+    assert not any(field in entries[1] for field in governance_crypto._MERKLE_FIELDS)
+    governance_crypto._verify_cache.clear()
+    assert verify_openpgp_signature(entries[1])
+
+
+def test_pgpy_verifies_without_gpg(monkeypatch):
+    """With PGPy installed, entries carrying their public key verify in-process"""
+    pytest.importorskip('pgpy')
+
+    with open(REG_FILE, 'r') as f:
+        registration = json.load(f)
+
+    def no_gpg(args, **kwargs):
+        raise AssertionError(f"gpg called: {args}")
+
+    monkeypatch.setattr(governance_crypto, '_run_gpg', no_gpg)
+    monkeypatch.setattr(governance_crypto, '_verify_cache', governance_crypto.OrderedDict())
+
+    assert verify_openpgp_signature(registration)
+
+
+@pytest.fixture(params=['coincurve', 'cryptography'])
+def ecdsa_backend(request, monkeypatch):
+    """Run an ECDSA test against each verification backend, with empty caches"""
+    if request.param == 'coincurve':
+        pytest.importorskip('coincurve')
+    else:
+        monkeypatch.setattr(governance_crypto, 'coincurve', None)
+    monkeypatch.setattr(governance_crypto, '_verify_cache', governance_crypto.OrderedDict())
+    governance_crypto._ecdsa_verifying_key.cache_clear()
+    yield request.param
+    # Parsed keys are backend specific
+    governance_crypto._ecdsa_verifying_key.cache_clear()
+
+
+def _ecdsa_signed_entry(signing_key, high_s=False):
+    """Entry signed the way mainscript registrations are, with the chosen S form"""
+    ecdsa = pytest.importorskip('ecdsa')
+    entry = {
+        'proof_name': 'ecdsa_test',
+        'proof_data': {'oath': 'I commit to transparency'},
+        'timestamp': 1234567890,
+        'public_key': signing_key.get_verifying_key().to_string().hex(),
+    }
+    payload = json.dumps(entry, sort_keys=True).encode('utf-8')
+    raw = signing_key.sign(payload, hashfunc=hashlib.sha256)
+
+    order = ecdsa.SECP256k1.order
+    r = int.from_bytes(raw[:32], 'big')
+    s = int.from_bytes(raw[32:], 'big')
+    s = min(s, order - s)
+    if high_s:
+        s = order - s
+    entry['signature'] = (r.to_bytes(32, 'big') + s.to_bytes(32, 'big')).hex()
+    return entry
+
+
+@pytest.fixture
+def signing_keys():
+    """Two unrelated SECP256k1 signing keys"""
+    ecdsa = pytest.importorskip('ecdsa')
+    return [ecdsa.SigningKey.generate(curve=ecdsa.SECP256k1) for _ in range(2)]
+
+
+@pytest.mark.parametrize('high_s', [False, True])
+def test_ecdsa_accepts_valid_signature(ecdsa_backend, signing_keys, high_s):
+    """python-ecdsa signatures verify in both low-S and high-S form"""
+    entry = _ecdsa_signed_entry(signing_keys[0], high_s=high_s)
+
+    assert verify_dual_signatures(entry)[0]
+    # Again from the verification cache
+    assert verify_dual_signatures(entry)[0]
+
+
+def test_ecdsa_rejects_invalid_signatures(ecdsa_backend, signing_keys):
+    """Tampered payloads, wrong keys and malformed signatures are rejected"""
+    entry = _ecdsa_signed_entry(signing_keys[0])
+    other_key = signing_keys[1].get_verifying_key().to_string().hex()
+
+    assert not verify_dual_signatures(dict(entry, proof_name='someone_else'))[0]
+    assert not verify_dual_signatures(dict(entry, public_key=other_key))[0]
+    assert not verify_dual_signatures(dict(entry, signature=entry['signature'][:-2]))[0]
+    assert not verify_dual_signatures(dict(entry, signature=entry['signature'] + '00'))[0]
+
+
+def test_ecdsa_cache_bound_to_public_key(ecdsa_backend, signing_keys):
+    """A cached success is not reused for the same signature and payload under another key"""
+    entry = _ecdsa_signed_entry(signing_keys[0])
+    payload = _canonical(entry, governance_crypto._SIGNATURE_FIELDS, separators=(', ', ': '))
+    other_key = signing_keys[1].get_verifying_key().to_string().hex()
+
+    assert governance_crypto._ecdsa_verify(entry['public_key'], entry['signature'], payload)
+    with pytest.raises(Exception):
+        governance_crypto._ecdsa_verify(other_key, entry['signature'], payload)
+
+
+def test_pgpy_defers_subkey_signatures_to_gpg():
+    """PGPy only reports signatures by the primary key; subkey signatures go to gpg"""
+    pgpy = pytest.importorskip('pgpy')
+    from pgpy.constants import PubKeyAlgorithm, EllipticCurveOID, KeyFlags, HashAlgorithm
+
+    key = pgpy.PGPKey.new(PubKeyAlgorithm.ECDSA, EllipticCurveOID.NIST_P256)
+    key.add_uid(pgpy.PGPUID.new('Subkey Test'), usage={KeyFlags.Certify, KeyFlags.Sign},
+                hashes=[HashAlgorithm.SHA256])
+    subkey = pgpy.PGPKey.new(PubKeyAlgorithm.ECDSA, EllipticCurveOID.NIST_P256)
+    key.add_subkey(subkey, usage={KeyFlags.Sign})
+    armored_key = str(key.pubkey)
+
+    primary_sig = str(key.sign(b'payload'))
+    subkey_sig = str(key.subkeys[subkey.fingerprint.keyid].sign(b'payload'))
+
+    info = governance_crypto._pgpy_verify(b'payload', primary_sig, armored_key)
+    assert info is not None and info['fingerprint'] == str(key.fingerprint)
+    assert governance_crypto._pgpy_verify(b'payload', subkey_sig, armored_key) is None
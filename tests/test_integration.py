@@ -7,12 +7,20 @@ Tests the complete workflow:
 2. Verify signature
 3. List members
 4. Submit a proposal
+5. Register a member
+6. Reuse verified identities across registrars
+7. Re-verify registrations edited on disk
+8. Skip malformed registration files when listing
 
 This test must pass before any production deployment.
 """
 
+import os
 import sys
 import json
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src to path
@@ -73,6 +81,10 @@ def test_identity_verification():
     is_valid_cached = registrar.verify_identity(fingerprint)
     assert is_valid_cached, "Cached identity verification failed"
 
+    # Fingerprints match registration files regardless of case
+    assert PublicRegistrar(reg_dir=str(reg_dir)).verify_identity(fingerprint.lower()), \
+        "Lower-case fingerprint not found"
+
     print("✅ Identity verification working (including cache)")
 
 
@@ -106,6 +118,136 @@ def test_proposal_submission():
     print(f"✅ Proposal submission working (ID: {result['proposal_id']})")
 
 
+def test_register_member():
+    """Test 5: Register a member into a fresh directory and verify it"""
+    print("\n[TEST 5] Testing member registration...")
+
+    reg_file = Path(__file__).parent.parent / 'registrations' / 'examples' / 'reg_AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79.json'
+    with open(reg_file, 'r') as f:
+        registration = json.load(f)
+
+    fingerprint = registration['openpgp_fingerprint']
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        registrar = PublicRegistrar(reg_dir=tmpdir)
+
+        # Unknown before registration
+        assert not registrar.verify_identity(fingerprint), "Unregistered identity verified"
+
+        assert registrar.register_member(registration, fingerprint), "Registration failed"
+        assert (Path(tmpdir) / reg_file.name).exists(), "Registration file not written"
+
+        # Known afterwards, on this registrar and on a fresh one
+        assert registrar.verify_identity(fingerprint), "Registered identity not verified"
+        assert PublicRegistrar(reg_dir=tmpdir).verify_identity(fingerprint), \
+            "Registered identity not verified from disk"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        registrar = PublicRegistrar(reg_dir=tmpdir)
+        assert not registrar.verify_identity(fingerprint), "Unregistered identity verified"
+
+        # Registered by someone else: picked up without waiting for a retry
+        assert PublicRegistrar(reg_dir=tmpdir).register_member(registration, fingerprint), \
+            "Registration failed"
+        assert registrar.verify_identity(fingerprint), "Identity registered elsewhere not verified"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Malformed entries fail on their own without stopping the batch
+        tampered = dict(registration, proof_name='someone_else')
+        batch = [registration, tampered, [1, 2], {'openpgp_fingerprint': 5}]
+        assert PublicRegistrar(reg_dir=tmpdir).register_members(batch) == 1, \
+            "Batch registration count wrong"
+
+    print("✅ Member registration working")
+
+
+def test_persistent_verified_cache():
+    """Test 6: A verified identity is remembered in the cache database"""
+    print("\n[TEST 6] Testing persistent verification cache...")
+
+    reg_dir = Path(__file__).parent.parent / 'registrations' / 'examples'
+    fingerprint = "AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_db = str(Path(tmpdir) / 'verified.db')
+
+        assert PublicRegistrar(reg_dir=str(reg_dir), cache_db=cache_db).verify_identity(fingerprint), \
+            "Identity verification failed"
+
+        # A fresh registrar finds this exact registration already verified
+        registrar = PublicRegistrar(reg_dir=str(reg_dir), cache_db=cache_db)
+        registration = registrar._load_registration(fingerprint)
+        assert registrar._store.is_verified(fingerprint, registration), "Verification not persisted"
+        assert registrar.verify_identity(fingerprint), "Cached identity not verified"
+
+        # Changed content is not covered by the earlier verification
+        edited = dict(registration, proof_name='someone_else')
+        assert not registrar._store.is_verified(fingerprint, edited), "Edited registration trusted"
+
+        # An unusable database is skipped rather than failing the command
+        corrupt_db = Path(tmpdir) / 'corrupt.db'
+        corrupt_db.write_bytes(b'not a database' * 100)
+        registrar = PublicRegistrar(reg_dir=str(reg_dir), cache_db=str(corrupt_db))
+        assert registrar._store is None, "Corrupt cache database used"
+        assert registrar.verify_identity(fingerprint), "Verification failed without cache database"
+
+    print("✅ Persistent verification cache working")
+
+
+def test_edited_registration_not_listed_as_verified():
+    """Test 7: A registration rewritten in place is re-verified"""
+    print("\n[TEST 7] Testing edited registration detection...")
+
+    src_file = Path(__file__).parent.parent / 'registrations' / 'examples' / 'reg_AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79.json'
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reg_file = Path(tmpdir) / src_file.name
+        shutil.copyfile(src_file, reg_file)
+        # Old enough that the mtime is trusted to reveal a later rewrite
+        old = reg_file.stat().st_mtime_ns - 10_000_000_000
+        os.utime(reg_file, ns=(old, old))
+
+        fingerprint = "AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79"
+        registrar = PublicRegistrar(reg_dir=tmpdir)
+        assert registrar.verify_identity(fingerprint.lower()), "Identity verification failed"
+        assert all(m['verified'] for m in registrar.list_members()), "Registration not verified"
+
+        # Overwriting the file does not change the directory mtime
+        registration = json.loads(reg_file.read_text())
+        registration['proof_name'] = 'tampered'
+        reg_file.write_text(json.dumps(registration, indent=2))
+        os.utime(reg_file, ns=(old + 1_000_000_000, old + 1_000_000_000))
+
+        assert registrar.list_members() == [], "Tampered registration listed as verified"
+        # Every spelling of the fingerprint shares one cache entry
+        assert not registrar.verify_identity(fingerprint.lower()), "Tampered identity verified"
+        assert not registrar.verify_identity(fingerprint), "Tampered identity verified"
+
+    print("✅ Edited registration re-verified")
+
+
+def test_malformed_registration_skipped():
+    """Test 8: A malformed registration file does not break the listing"""
+    print("\n[TEST 8] Testing malformed registration handling...")
+
+    src_file = Path(__file__).parent.parent / 'registrations' / 'examples' / 'reg_AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79.json'
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shutil.copyfile(src_file, Path(tmpdir) / src_file.name)
+        (Path(tmpdir) / 'reg_0000000000000000000000000000000000000000.json').write_text('["x"]')
+
+        members = PublicRegistrar(reg_dir=tmpdir).list_members()
+        assert [m['proof_name'] for m in members] == ['the_nurse'], f"Unexpected members: {members}"
+
+        # A differently-cased copy of the same fingerprint does not replace
+        # the normalized file name
+        (Path(tmpdir) / 'reg_ac507646e0141d69cc0a1b14d5af4f7dccd21b79.json').write_text('["x"]')
+        members = PublicRegistrar(reg_dir=tmpdir).list_members()
+        assert [m['file'] for m in members] == [src_file.name], f"Unexpected members: {members}"
+
+    print("✅ Malformed registration skipped")
+
+
 def main():
     """Run all integration tests"""
     print("=" * 70)
@@ -116,20 +258,29 @@ def main():
         test_the_nurse_registration,
         test_list_members,
         test_identity_verification,
-        test_proposal_submission
+        test_proposal_submission,
+        test_register_member,
+        test_persistent_verified_cache,
+        test_edited_registration_not_listed_as_verified,
+        test_malformed_registration_skipped
     ]
 
     failed = []
 
-    for test in tests:
-        try:
-            test()
-        except AssertionError as e:
-            print(f"❌ {test.__name__} FAILED: {e}")
-            failed.append(test.__name__)
-        except Exception as e:
-            print(f"❌ {test.__name__} ERROR: {e}")
-            failed.append(test.__name__)
+    # Tests are independent and spend their time in gpg subprocesses,
+    # so run them side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(tests))) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+            except AssertionError as e:
+                print(f"❌ {name} FAILED: {e}")
+                failed.append(name)
+            except Exception as e:
+                print(f"❌ {name} ERROR: {e}")
+                failed.append(name)
 
     # Summary
     print("\n" + "=" * 70)
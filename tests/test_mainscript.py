@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for mainscript helpers that do not need a GPG secret key
+"""
+
+import sys
+import hashlib
+
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import governance_crypto
+import mainscript
+from governance_crypto import _canonical, _SIGNATURE_FIELDS, add_openpgp_signature
+
+
+def test_loads_keeps_big_integers():
+    """Integers outside orjson's 64-bit range parse exactly, as with json.loads"""
+    document = '{"big": 1180591620717411303424, "low": -9223372036854775809, "max": 18446744073709551615}'
+
+    for data in (document, document.encode('utf-8')):
+        parsed = mainscript._loads(data)
+        assert parsed == {'big': 2 ** 70, 'low': -2 ** 63 - 1, 'max': 2 ** 64 - 1}
+        assert all(isinstance(v, int) for v in parsed.values())
+
+
+class _DigestSigner:
+    """Signer whose 'signature' is a digest of the signed data"""
+
+    def sign_data(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return 'fake:' + hashlib.sha256(data).hexdigest()
+
+    def export_public_key(self):
+        return 'fake public key'
+
+
+# Separate cases: a big integer alone already sends the write to the stdlib encoder
+@pytest.mark.parametrize('proof_data', [
+    {'score': float('nan'), 'limit': float('inf')},
+    {'big': 2 ** 70},
+], ids=['non-finite', 'big-int'])
+def test_register_member_keeps_signed_payload(monkeypatch, tmp_path, proof_data):
+    """NaN/Infinity and integers beyond 64 bits are written back exactly as they were signed"""
+    signer = _DigestSigner()
+
+    def fake_gpg_verify(data, signature):
+        return signature == signer.sign_data(data), {'valid': True}
+
+    monkeypatch.setattr(governance_crypto, '_signer', lambda fingerprint: signer)
+    monkeypatch.setattr(governance_crypto, '_gpg_verify', fake_gpg_verify)
+    monkeypatch.setattr(governance_crypto, '_import_public_key', lambda armored_key: None)
+    monkeypatch.setattr(governance_crypto, 'pgpy', None)
+    monkeypatch.setattr(governance_crypto, '_verify_cache', governance_crypto.OrderedDict())
+
+    fingerprint = 'AC507646E0141D69CC0A1B14D5AF4F7DCCD21B79'
+    registration = add_openpgp_signature({
+        'proof_name': 'edge_values',
+        'proof_data': proof_data,
+        'timestamp': 1234567890,
+    }, fingerprint)
+    payload = _canonical(registration, _SIGNATURE_FIELDS)
+
+    registrar = mainscript.PublicRegistrar(reg_dir=str(tmp_path))
+    assert registrar.register_member(registration, fingerprint)
+
+    saved = mainscript._loads((tmp_path / f"reg_{fingerprint}.json").read_bytes())
+    assert _canonical(saved, _SIGNATURE_FIELDS) == payload
+
+    governance_crypto._verify_cache.clear()
+    assert governance_crypto.verify_openpgp_signature(saved)